@@ -22,6 +22,66 @@ REGION_WEIGHTS = {
     "Latgale": 0.09,
 }
 
+# Causal chain narratives by shock type and direction of the first-round GDP impact.
+_CHAIN_TRANSFERS_EXPANSION = (
+    "Policy increases household disposable income via transfer payments",
+    "Liquidity-constrained households increase consumption immediately",
+    "Higher consumption demand → firms increase production",
+    "Increased production → more employment and wage income",
+    "Multiplier effects through second-round consumption",
+)
+_CHAIN_TRANSFERS_CONTRACTION = (
+    "Policy reduces household disposable income via transfer cuts",
+    "Consumption falls, especially for liquidity-constrained households",
+    "Lower demand → firms reduce production and employment",
+    "Negative multiplier effects through income channels",
+    "Budget balance improves but at cost of output and employment",
+)
+_CHAIN_PURCHASES_EXPANSION = (
+    "Government increases direct purchases of goods and services",
+    "Firms receive additional demand → increase output",
+    "Employment increases to meet production needs",
+    "Higher wages → additional consumption (induced effect)",
+    "Investment responds to output expansion (accelerator)",
+)
+_CHAIN_PURCHASES_CONTRACTION = (
+    "Government reduces purchases → direct demand shock",
+    "Affected sectors reduce production and employment",
+    "Income effects → reduced consumption",
+    "Budget consolidation at expense of short-term growth",
+)
+_CHAIN_GENERIC = (
+    "Policy shock affects economic activity through fiscal channels",
+    "Multiplier effects propagate through economy",
+    "Adjustment occurs gradually over multiple quarters",
+)
+
+# Narrative winners/losers by direction of the first-round GDP impact.
+_WINNERS_EXPANSION = (
+    "Households receiving transfers or benefiting from spending",
+    "Service sector employment (restaurants, retail, personal services)",
+    "Riga region (largest employment concentration)",
+    "Government revenue via automatic stabilizers",
+)
+_LOSERS_EXPANSION = (
+    "Fiscal sustainability metrics (higher debt)",
+    "Taxpayers (potential future tax burden)",
+    "Competing spending priorities (crowding out)",
+)
+_WINNERS_CONTRACTION = (
+    "Government budget balance (deficit reduction)",
+    "Long-term fiscal sustainability",
+    "Future generations (lower debt burden)",
+    "Bond markets (reduced sovereign risk)",
+)
+_LOSERS_CONTRACTION = (
+    "Current transfer recipients",
+    "Low-income households (higher MPC)",
+    "Regions with high social spending dependency (Latgale, Vidzeme)",
+    "Service sector employment",
+    "Short-term economic growth",
+)
+
 
 class DSGESimulationEngine:
     """
@@ -215,38 +275,15 @@ class DSGESimulationEngine:
         is_expansion = first_round["gdp_impact_eur_m"] > 0
 
         if shock.delta_transfers != 0:
-            if is_expansion:
-                chain.append(
-                    "Policy increases household disposable income via transfer payments"
-                )
-                chain.append("Liquidity-constrained households increase consumption immediately")
-                chain.append("Higher consumption demand → firms increase production")
-                chain.append("Increased production → more employment and wage income")
-                chain.append("Multiplier effects through second-round consumption")
-            else:
-                chain.append("Policy reduces household disposable income via transfer cuts")
-                chain.append("Consumption falls, especially for liquidity-constrained households")
-                chain.append("Lower demand → firms reduce production and employment")
-                chain.append("Negative multiplier effects through income channels")
-                chain.append("Budget balance improves but at cost of output and employment")
-
+            chain.extend(
+                _CHAIN_TRANSFERS_EXPANSION if is_expansion else _CHAIN_TRANSFERS_CONTRACTION
+            )
         elif shock.delta_gov_consumption != 0 or shock.delta_gov_investment != 0:
-            if is_expansion:
-                chain.append("Government increases direct purchases of goods and services")
-                chain.append("Firms receive additional demand → increase output")
-                chain.append("Employment increases to meet production needs")
-                chain.append("Higher wages → additional consumption (induced effect)")
-                chain.append("Investment responds to output expansion (accelerator)")
-            else:
-                chain.append("Government reduces purchases → direct demand shock")
-                chain.append("Affected sectors reduce production and employment")
-                chain.append("Income effects → reduced consumption")
-                chain.append("Budget consolidation at expense of short-term growth")
-
+            chain.extend(
+                _CHAIN_PURCHASES_EXPANSION if is_expansion else _CHAIN_PURCHASES_CONTRACTION
+            )
         else:
-            chain.append("Policy shock affects economic activity through fiscal channels")
-            chain.append("Multiplier effects propagate through economy")
-            chain.append("Adjustment occurs gradually over multiple quarters")
+            chain.extend(_CHAIN_GENERIC)
 
         return chain
 
@@ -258,31 +295,11 @@ class DSGESimulationEngine:
         is_expansion = solution["first_round"]["gdp_impact_eur_m"] > 0
 
         if is_expansion:
-            winners.extend([
-                "Households receiving transfers or benefiting from spending",
-                "Service sector employment (restaurants, retail, personal services)",
-                "Riga region (largest employment concentration)",
-                "Government revenue via automatic stabilizers",
-            ])
-            losers.extend([
-                "Fiscal sustainability metrics (higher debt)",
-                "Taxpayers (potential future tax burden)",
-                "Competing spending priorities (crowding out)",
-            ])
+            winners.extend(_WINNERS_EXPANSION)
+            losers.extend(_LOSERS_EXPANSION)
         else:
-            winners.extend([
-                "Government budget balance (deficit reduction)",
-                "Long-term fiscal sustainability",
-                "Future generations (lower debt burden)",
-                "Bond markets (reduced sovereign risk)",
-            ])
-            losers.extend([
-                "Current transfer recipients",
-                "Low-income households (higher MPC)",
-                "Regions with high social spending dependency (Latgale, Vidzeme)",
-                "Service sector employment",
-                "Short-term economic growth",
-            ])
+            winners.extend(_WINNERS_CONTRACTION)
+            losers.extend(_LOSERS_CONTRACTION)
 
         return winners, losers
 
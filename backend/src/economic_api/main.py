@@ -145,8 +145,10 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
         request_id=request_id,
         details=details,
     )
-    headers = dict(exc.headers or {})
-    headers[REQUEST_ID_HEADER] = request_id
+    if exc.headers:
+        headers = {**exc.headers, REQUEST_ID_HEADER: request_id}
+    else:
+        headers = {REQUEST_ID_HEADER: request_id}
     return JSONResponse(status_code=exc.status_code, content=payload, headers=headers)
 
 
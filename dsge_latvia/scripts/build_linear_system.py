@@ -1,17 +1,21 @@
 from __future__ import annotations
 
+import ast
+import functools
 import json
 import math
+import os
 import re
 from pathlib import Path
-from typing import Callable
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 
 import numpy as np
 import yaml
 from scipy.linalg import qr
-from scipy.stats import norm
 
 from lv_fiscal_dsge.steady_state import (
+    SteadyState,
     load_parameters,
     solve_full_steady_state,
     compute_financial_frictions_metrics,
@@ -26,6 +30,43 @@ DOCS_DIR = ROOT / "docs"
 TOKEN_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
 SKIP_RE = re.compile(r"int_0|sum_\{|\bsum\{|\bdj\b")
 SKIP_INDEX_RE = re.compile(r"_[j],t(?:[+-]1)?")
+A_CALL_RE = re.compile(r"\ba\(")
+INDEX_COMMA_RE = re.compile(r"([A-Za-z0-9]),([A-Za-z0-9])")
+LEAD_RE = re.compile(r"([A-Za-z_][A-Za-z0-9_]*_t[A-Za-z0-9_]*)\+1\b")
+LAG_RE = re.compile(r"([A-Za-z_][A-Za-z0-9_]*_t[A-Za-z0-9_]*)-1\b")
+LEAD_INFIX_RE = re.compile(r"_t_p1_([A-Za-z0-9_]+)")
+LAG_INFIX_RE = re.compile(r"_t_m1_([A-Za-z0-9_]+)")
+
+# Residuals come from the normalized model plus fiscal rules and shock processes.
+SECTIONS = ("appendix_c_normalized_model", "fiscal_rule_equations", "shock_processes")
+# Helper functions callable from equations; never state variables.
+FUNCTION_NAMES = frozenset(
+    {
+        "log",
+        "exp",
+        "min",
+        "max",
+        "S_tilde",
+        "S_tilde_prime",
+        "S_tilde_double_prime",
+        "a_util",
+        "a_prime",
+        "G",
+        "Gamma",
+        "G_omega",
+        "Gamma_omega",
+    }
+)
+
+# Set DSGE_NUMBA=1 to JIT-compile the residual kernel. Compilation takes several
+# seconds, so it only pays off when the kernel is evaluated many times. Numba is
+# only imported on opt-in; the import alone is a noticeable share of a NumPy build.
+USE_NUMBA = os.environ.get("DSGE_NUMBA") == "1"
+if USE_NUMBA:
+    try:
+        import numba
+    except ImportError:  # pragma: no cover - optional accelerator
+        USE_NUMBA = False
 
 
 def _load_yaml(path: Path) -> dict:
@@ -47,18 +88,18 @@ def _normalize_expr(expr: str) -> str:
     expr = expr.replace("S''(", "S_tilde_double_prime(")
     expr = expr.replace("S'(", "S_tilde_prime(")
     expr = expr.replace("a'(", "a_prime(")
-    expr = re.sub(r"\ba\(", "a_util(", expr)
+    expr = A_CALL_RE.sub("a_util(", expr)
     expr = expr.replace("E_t", "").replace("E_0", "")
     expr = expr.replace("E_t[", "(").replace("E_0[", "(")
     expr = expr.replace("{", "(").replace("}", ")")
     expr = expr.replace("[", "(").replace("]", ")")
-    expr = re.sub(r"([A-Za-z0-9]),([A-Za-z0-9])", r"\1_\2", expr)
+    expr = INDEX_COMMA_RE.sub(r"\1_\2", expr)
     expr = expr.replace("_t+1", "_t_p1").replace("_t-1", "_t_m1")
     expr = expr.replace("t+1", "t_p1").replace("t-1", "t_m1")
-    expr = re.sub(r"([A-Za-z_][A-Za-z0-9_]*_t[A-Za-z0-9_]*)\+1\b", r"\1_p1", expr)
-    expr = re.sub(r"([A-Za-z_][A-Za-z0-9_]*_t[A-Za-z0-9_]*)-1\b", r"\1_m1", expr)
-    expr = re.sub(r"_t_p1_([A-Za-z0-9_]+)", r"_t_\1_p1", expr)
-    expr = re.sub(r"_t_m1_([A-Za-z0-9_]+)", r"_t_\1_m1", expr)
+    expr = LEAD_RE.sub(r"\1_p1", expr)
+    expr = LAG_RE.sub(r"\1_m1", expr)
+    expr = LEAD_INFIX_RE.sub(r"_t_\1_p1", expr)
+    expr = LAG_INFIX_RE.sub(r"_t_\1_m1", expr)
     expr = expr.replace(";", ",")
     return expr
 
@@ -73,89 +114,134 @@ def _to_residual(expr: str) -> str:
     return expr
 
 
+def _jit(func: Callable[..., float]) -> Callable[..., float]:
+    """Compile a scalar helper with Numba when the JIT kernel is enabled."""
+    if not USE_NUMBA:
+        return func
+    return numba.njit(func)
+
+
+def _np_min(*args: Any) -> Any:
+    # Variadic like the builtin; np.minimum would read a third argument as ``out``.
+    return functools.reduce(np.minimum, args)
+
+
+def _np_max(*args: Any) -> Any:
+    return functools.reduce(np.maximum, args)
+
+
+def _elementwise(func: Callable[..., float]) -> Callable[..., Any]:
+    """Make a scalar helper callable from the generated residual kernel.
+
+    The NumPy kernel passes whole state columns, so the helper is vectorized; the
+    Numba kernel loops over states and calls the ``_jit``-compiled helper directly.
+    """
+    if USE_NUMBA:
+        return func
+    return np.vectorize(func, otypes=[float])
+
+
+_INV_SQRT_2 = 1.0 / math.sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+
+@_jit
+def _norm_cdf(x: float) -> float:
+    # Same erfc form as scipy.special.ndtr: keeps relative accuracy in the lower tail.
+    return 0.5 * math.erfc(-x * _INV_SQRT_2)
+
+
+@_jit
+def _norm_pdf(x: float) -> float:
+    return _INV_SQRT_2PI * math.exp(-0.5 * x * x)
+
+
 def _build_eval_env(params: dict[str, float]) -> dict[str, object]:
     mu_zplus = _mu_zplus(params)
+    mu_psi = params["mu_psi"]
     S_dd = params.get("S_dd", 0.0)
 
+    sqrt_S = math.sqrt(S_dd)
+    shift = mu_zplus * mu_psi
+
+    @_jit
     def S_tilde(x: float) -> float:
         if S_dd == 0:
             return 0.0
-        return 0.5 * (
-            math.exp(math.sqrt(S_dd) * (x - mu_zplus * params["mu_psi"]))
-            + math.exp(-math.sqrt(S_dd) * (x - mu_zplus * params["mu_psi"]))
-            - 2.0
-        )
+        return math.cosh(sqrt_S * (x - shift)) - 1.0
 
+    @_jit
     def S_tilde_prime(x: float) -> float:
         if S_dd == 0:
             return 0.0
-        return 0.5 * math.sqrt(S_dd) * (
-            math.exp(math.sqrt(S_dd) * (x - mu_zplus * params["mu_psi"]))
-            - math.exp(-math.sqrt(S_dd) * (x - mu_zplus * params["mu_psi"]))
-        )
+        return sqrt_S * math.sinh(sqrt_S * (x - shift))
 
+    @_jit
     def S_tilde_double_prime(x: float) -> float:
         if S_dd == 0:
             return 0.0
-        return 0.5 * S_dd * (
-            math.exp(math.sqrt(S_dd) * (x - mu_zplus * params["mu_psi"]))
-            + math.exp(-math.sqrt(S_dd) * (x - mu_zplus * params["mu_psi"]))
-        )
+        return S_dd * math.cosh(sqrt_S * (x - shift))
 
     sigma_a = params.get("sigma_a", 0.0)
     sigma_b = params.get("sigma_b", 0.0)
 
+    @_jit
     def a_util(u: float) -> float:
         return 0.5 * sigma_b * sigma_a * u * u + sigma_b * (1.0 - sigma_a) * u + sigma_b * (
             sigma_a / 2.0 - 1.0
         )
 
+    @_jit
     def a_util_prime(u: float) -> float:
         return sigma_b * sigma_a * u + sigma_b * (1.0 - sigma_a)
 
+    @_jit
     def G_func(omega: float, sigma: float) -> float:
         if sigma <= 0 or omega <= 0:
             return 0.0
-        return float(norm.cdf((math.log(omega) - 0.5 * sigma * sigma) / sigma))
+        return _norm_cdf((math.log(omega) - 0.5 * sigma * sigma) / sigma)
 
+    @_jit
     def Gamma_func(omega: float, sigma: float) -> float:
         if sigma <= 0 or omega <= 0:
             return 0.0
-        F = float(norm.cdf((math.log(omega) + 0.5 * sigma * sigma) / sigma))
+        F = _norm_cdf((math.log(omega) + 0.5 * sigma * sigma) / sigma)
         G = G_func(omega, sigma)
         return omega * (1.0 - F) + G
 
+    @_jit
     def G_omega_func(omega: float, sigma: float) -> float:
         if sigma <= 0 or omega <= 0:
             return 0.0
         a = (math.log(omega) - 0.5 * sigma * sigma) / sigma
-        return float(norm.pdf(a) / (omega * sigma))
+        return _norm_pdf(a) / (omega * sigma)
 
+    @_jit
     def Gamma_omega_func(omega: float, sigma: float) -> float:
         if sigma <= 0 or omega <= 0:
             return 0.0
         a = (math.log(omega) - 0.5 * sigma * sigma) / sigma
         b = (math.log(omega) + 0.5 * sigma * sigma) / sigma
-        F = float(norm.cdf(b))
-        phi_a = float(norm.pdf(a))
-        phi_b = float(norm.pdf(b))
+        F = _norm_cdf(b)
+        phi_a = _norm_pdf(a)
+        phi_b = _norm_pdf(b)
         return (1.0 - F) - phi_b / sigma + phi_a / (omega * sigma)
 
     env: dict[str, object] = {
-        "log": math.log,
-        "exp": math.exp,
-        "min": min,
-        "max": max,
-        "S_tilde": S_tilde,
-        "S_tilde_prime": S_tilde_prime,
-        "S_tilde_double_prime": S_tilde_double_prime,
-        "a_util": a_util,
-        "a_prime": a_util_prime,
-        "G": G_func,
-        "Gamma": Gamma_func,
-        "G_omega": G_omega_func,
-        "Gamma_omega": Gamma_omega_func,
+        "S_tilde": _elementwise(S_tilde),
+        "S_tilde_prime": _elementwise(S_tilde_prime),
+        "S_tilde_double_prime": _elementwise(S_tilde_double_prime),
+        "a_util": _elementwise(a_util),
+        "a_prime": _elementwise(a_util_prime),
+        "G": _elementwise(G_func),
+        "Gamma": _elementwise(Gamma_func),
+        "G_omega": _elementwise(G_omega_func),
+        "Gamma_omega": _elementwise(Gamma_omega_func),
     }
+    if USE_NUMBA:
+        env.update({"log": math.log, "exp": math.exp, "min": min, "max": max})
+    else:
+        env.update({"log": np.log, "exp": np.exp, "min": _np_min, "max": _np_max})
     env.update(params)
     env["mu_zplus"] = mu_zplus
     env.setdefault("a", 0.0)
@@ -170,9 +256,18 @@ def _build_eval_env(params: dict[str, float]) -> dict[str, object]:
     return env
 
 
-def _steady_state_map(params: dict[str, float]) -> dict[str, float]:
+@functools.lru_cache(maxsize=None)
+def _solve_steady_state_cached(
+    params_items: tuple[tuple[str, float], ...],
+) -> tuple[SteadyState, dict[str, float]]:
+    # Keyed on the sorted parameter items so repeated builds in one process solve once.
+    params = dict(params_items)
     ss = solve_full_steady_state(params)
-    fin = compute_financial_frictions_metrics(ss, params)
+    return ss, compute_financial_frictions_metrics(ss, params)
+
+
+def _steady_state_map(params: dict[str, float]) -> dict[str, float]:
+    ss, fin = _solve_steady_state_cached(tuple(sorted(params.items())))
     mu_zplus = _mu_zplus(params)
     mu_psi = params["mu_psi"]
     beta = params["beta"]
@@ -195,10 +290,11 @@ def _steady_state_map(params: dict[str, float]) -> dict[str, float]:
         if L > 0
         else 1.0
     )
-    vartheta_p = vartheta / (1.0 - rho * disc) if (1.0 - rho * disc) != 0 else vartheta
+    match_disc = 1.0 - rho * disc
+    vartheta_p = vartheta / match_disc if match_disc != 0 else vartheta
     w_bar = ss.wage
-    w_p_bar = (1.0 + tau_w_e) * w_bar / (1.0 - rho * disc) if (1.0 - rho * disc) != 0 else w_bar
-    w_t_p = (1.0 - tau_y - tau_w_w) * w_bar / (1.0 - rho * disc) if (1.0 - rho * disc) != 0 else w_bar
+    w_p_bar = (1.0 + tau_w_e) * w_bar / match_disc if match_disc != 0 else w_bar
+    w_t_p = (1.0 - tau_y - tau_w_w) * w_bar / match_disc if match_disc != 0 else w_bar
 
     f_bar = params.get("job_finding_rate", 0.0)
     v_rate = params.get("vacancy_rate", 0.0)
@@ -206,7 +302,7 @@ def _steady_state_map(params: dict[str, float]) -> dict[str, float]:
     chi = f_bar * searchers / L if L > 0 else 0.0
     Q_bar = params.get("Q_bar", 1.0)
     Q = chi / v_rate if v_rate else Q_bar
-    A = (1.0 - rho) * disc / (1.0 - rho * disc) if (1.0 - rho * disc) != 0 else 0.0
+    A = (1.0 - rho) * disc / match_disc if match_disc != 0 else 0.0
     b_u = params.get("bshare", 0.0) * w_bar
     denom = 1.0 - f_bar * A - (1.0 - f_bar) * disc
     if denom != 0.0:
@@ -313,10 +409,10 @@ def _steady_state_map(params: dict[str, float]) -> dict[str, float]:
     return mapping
 
 
-def _build_residual_functions(
+def _build_residuals(
     equations: list[dict],
     params: dict[str, float],
-) -> tuple[list[str], list[Callable[[dict[str, float]], float]], list[str], list[dict]]:
+) -> tuple[list[str], list[str], list[dict]]:
     residuals: list[str] = []
     ids: list[str] = []
     skipped: list[dict] = []
@@ -334,29 +430,18 @@ def _build_residual_functions(
             residuals.append(expr)
             ids.append(entry.get("id", ""))
 
-    env = _build_eval_env(params)
-
-    funcs: list[Callable[[dict[str, float]], float]] = []
     compiled: list[str] = []
+    compiled_ids: list[str] = []
     for expr, eq_id in zip(residuals, ids):
         try:
-            code = compile(expr, "<equation>", "eval")
+            ast.parse(expr, mode="eval")
         except SyntaxError:
             skipped.append({"id": eq_id, "reason": "syntax_error"})
             continue
-
-        def _make_func(code_obj):
-            def _f(values: dict[str, float]) -> float:
-                local_env = env.copy()
-                local_env.update(values)
-                return float(eval(code_obj, {"__builtins__": {}}, local_env))
-
-            return _f
-
-        funcs.append(_make_func(code))
         compiled.append(expr)
+        compiled_ids.append(eq_id)
 
-    return compiled, funcs, ids[: len(compiled)], skipped
+    return compiled, compiled_ids, skipped
 
 
 def _strip_time_shift(token: str) -> str:
@@ -373,25 +458,10 @@ def _strip_time_shift(token: str) -> str:
 
 def _collect_variables(residuals: list[str], params: dict[str, float]) -> list[str]:
     param_names = set(params.keys()) | {"mu_zplus"}
-    function_names = {
-        "log",
-        "exp",
-        "min",
-        "max",
-        "S_tilde",
-        "S_tilde_prime",
-        "S_tilde_double_prime",
-        "a_util",
-        "a_prime",
-        "G",
-        "Gamma",
-        "G_omega",
-        "Gamma_omega",
-    }
     vars_t: set[str] = set()
     for expr in residuals:
         for tok in TOKEN_RE.findall(expr):
-            if tok in function_names:
+            if tok in FUNCTION_NAMES:
                 continue
             if tok in param_names:
                 continue
@@ -413,24 +483,179 @@ def _collect_shocks(residuals: list[str]) -> list[str]:
     return sorted(shocks)
 
 
+class _StateIndexer(ast.NodeTransformer):
+    """Rewrite references to state entries as reads ``_v[row, i]``.
+
+    ``row`` is ``...`` for whole-column reads or the name of a loop variable; with
+    ``row=None`` the state is a single flat vector and reads become ``_v[i]``.
+    """
+
+    def __init__(self, index: dict[str, int], row: ast.expr | None) -> None:
+        self.index = index
+        self.row = row
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        pos = self.index.get(node.id)
+        if pos is None:
+            return node
+        if self.row is None:
+            key: ast.expr = ast.Constant(value=pos)
+        else:
+            key = ast.Tuple(elts=[self.row, ast.Constant(value=pos)], ctx=ast.Load())
+        return ast.copy_location(
+            ast.Subscript(value=ast.Name(id="_v", ctx=ast.Load()), slice=key, ctx=ast.Load()),
+            node,
+        )
+
+
+def _compile_residual_function(
+    expr: str,
+    env: Mapping[str, object],
+    index: dict[str, int],
+) -> Callable[[np.ndarray], float]:
+    """Compile one residual into ``_f(state)`` with env names bound as globals."""
+    tree = ast.parse(expr, mode="eval")
+    constants = {
+        node.id
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Name) and node.id not in index and node.id in env
+    }
+    body = ast.unparse(_StateIndexer(index, None).visit(tree).body)
+    source = f"def _f(_v):\n    return _float({body})\n"
+    namespace: dict[str, object] = {name: env[name] for name in constants}
+    namespace["_float"] = float
+    namespace["__builtins__"] = {}
+    exec(compile(source, "<equation>", "exec"), namespace)
+    return namespace["_f"]  # type: ignore[return-value]
+
+
+def _compile_residual_kernel(
+    residuals: list[str],
+    env: Mapping[str, object],
+    index: dict[str, int],
+) -> Callable[[np.ndarray], np.ndarray]:
+    """Compile all residuals into one function of a flat state vector.
+
+    Names found in ``index`` are read from the last axis of the state array; every
+    other name is bound once from ``env`` (parameters and helper functions), so
+    evaluating the kernel involves no dict copies or ``eval`` name lookups. The
+    kernel maps an ``(m, n_state)`` stack of states to an ``(m, n_residuals)`` array.
+    """
+    if USE_NUMBA:
+        indexer = _StateIndexer(index, ast.Name(id="_r", ctx=ast.Load()))
+    else:
+        indexer = _StateIndexer(index, ast.Constant(value=Ellipsis))
+    lines: list[str] = []
+    constants: set[str] = set()
+    for expr in residuals:
+        tree = ast.parse(expr, mode="eval")
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name) and node.id not in index:
+                constants.add(node.id)
+        lines.append(ast.unparse(indexer.visit(tree).body))
+    missing = sorted(constants - env.keys())
+    if missing:
+        raise NameError("Unresolved names in residuals: " + ", ".join(missing))
+
+    source = "def _F(_v):\n"
+    if USE_NUMBA:
+        source += f"    _out = _np.empty((_v.shape[0], {len(lines)}))\n"
+        # Perturbed states are independent rows, so spread them across threads.
+        source += "    for _r in _prange(_v.shape[0]):\n"
+        source += "".join(f"        _out[_r, {i}] = {line}\n" for i, line in enumerate(lines))
+    else:
+        source += f"    _out = _np.empty(_v.shape[:-1] + ({len(lines)},))\n"
+        source += "".join(f"    _out[..., {i}] = {line}\n" for i, line in enumerate(lines))
+    source += "    return _out\n"
+    namespace: dict[str, object] = {name: env[name] for name in constants}
+    namespace["_np"] = np
+    namespace["__builtins__"] = {}
+    if USE_NUMBA:
+        namespace["_prange"] = numba.prange
+    exec(compile(source, "<residual_kernel>", "exec"), namespace)
+    kernel = namespace["_F"]
+    if USE_NUMBA:
+        # Compile eagerly for the stacked perturbation matrices built below.
+        kernel = numba.njit(["float64[:, :](float64[:, :])"], parallel=True)(kernel)
+    return kernel  # type: ignore[return-value]
+
+
+def _affine_terms(
+    node: ast.expr,
+    env: Mapping[str, object],
+    index: dict[str, int],
+) -> tuple[dict[int, float], float] | None:
+    """Split ``node`` into state coefficients and a constant, or ``None`` if nonlinear.
+
+    Subtrees without state names are evaluated once against ``env``.
+    """
+    if not any(isinstance(sub, ast.Name) and sub.id in index for sub in ast.walk(node)):
+        code = compile(ast.Expression(body=node), "<equation>", "eval")
+        return {}, float(eval(code, {"__builtins__": {}}, env))
+    if isinstance(node, ast.Name):
+        return {index[node.id]: 1.0}, 0.0
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        inner = _affine_terms(node.operand, env, index)
+        if inner is None:
+            return None
+        sign = -1.0 if isinstance(node.op, ast.USub) else 1.0
+        return {pos: sign * coef for pos, coef in inner[0].items()}, sign * inner[1]
+    if not isinstance(node, ast.BinOp):
+        return None
+    left = _affine_terms(node.left, env, index)
+    right = _affine_terms(node.right, env, index)
+    if left is None or right is None:
+        return None
+    if isinstance(node.op, (ast.Add, ast.Sub)):
+        sign = -1.0 if isinstance(node.op, ast.Sub) else 1.0
+        coeffs = dict(left[0])
+        for pos, coef in right[0].items():
+            coeffs[pos] = coeffs.get(pos, 0.0) + sign * coef
+        return coeffs, left[1] + sign * right[1]
+    if isinstance(node.op, ast.Mult):
+        if not left[0]:
+            left, right = right, left
+        if right[0]:
+            return None
+        scale = right[1]
+        return {pos: scale * coef for pos, coef in left[0].items()}, scale * left[1]
+    if isinstance(node.op, ast.Div) and not right[0] and right[1] != 0.0:
+        scale = 1.0 / right[1]
+        return {pos: scale * coef for pos, coef in left[0].items()}, scale * left[1]
+    return None
+
+
+def _linear_coefficients(
+    residual: str,
+    env: Mapping[str, object],
+    index: dict[str, int],
+) -> dict[int, float] | None:
+    """State-slot coefficients of a residual that is affine in the state, else ``None``."""
+    try:
+        terms = _affine_terms(ast.parse(residual, mode="eval").body, env, index)
+    except (ArithmeticError, TypeError, ValueError):
+        return None
+    return None if terms is None else terms[0]
+
+
 def _numeric_jacobian(
-    funcs: list[Callable[[dict[str, float]], float]],
-    values: dict[str, float],
-    var_list: list[str],
+    kernel: Callable[[np.ndarray], np.ndarray],
+    state: np.ndarray,
+    cols: list[int],
     eps: float,
 ) -> np.ndarray:
-    base = np.array([f(values) for f in funcs], dtype=float)
-    jac = np.zeros((len(funcs), len(var_list)))
-    for j, var in enumerate(var_list):
-        orig = values.get(var, 1.0)
-        h = eps if abs(orig) < 1.0 else eps * abs(orig)
-        values[var] = orig + h
-        f_plus = np.array([f(values) for f in funcs], dtype=float)
-        values[var] = orig - h
-        f_minus = np.array([f(values) for f in funcs], dtype=float)
-        values[var] = orig
-        jac[:, j] = (f_plus - f_minus) / (2.0 * h)
-    return jac
+    # Two-sided differences for every column at once: rows [0, n) carry the +h
+    # perturbations and rows [n, 2n) the -h ones, evaluated in a single kernel call.
+    cols_arr = np.asarray(cols, dtype=np.intp)
+    n = cols_arr.size
+    orig = state[cols_arr]
+    h = np.where(np.abs(orig) < 1.0, eps, eps * np.abs(orig))
+    rows = np.arange(n)
+    points = np.tile(state, (2 * n, 1))
+    points[rows, cols_arr] = orig + h
+    points[n + rows, cols_arr] = orig - h
+    f = kernel(points)
+    return (f[:n] - f[n:]).T / (2.0 * h)
 
 
 def _lag_name(var: str) -> str:
@@ -446,12 +671,11 @@ def main() -> None:
     spec = _load_yaml(MODEL_DIR / "spec.yaml")
     params = load_parameters()
 
-    # Build residuals from the normalized model plus fiscal rules and shock processes.
-    sections = ["appendix_c_normalized_model", "fiscal_rule_equations", "shock_processes"]
     equations = []
-    for section in sections:
+    for section in SECTIONS:
         equations.extend(_collect_equations(spec, section))
-    residuals, funcs, ids, skipped = _build_residual_functions(equations, params)
+    env = MappingProxyType(_build_eval_env(params))
+    residuals, ids, skipped = _build_residuals(equations, params)
     full_variables = _collect_variables(residuals, params)
     variables = list(full_variables)
     allowlist_path = MODEL_DIR / "endogenous_variables.yaml"
@@ -471,32 +695,41 @@ def main() -> None:
     shocks = _collect_shocks(residuals)
 
     ss_map = _steady_state_map(params)
-    # Use the full variable set for steady-state evaluation.
-    values = {var: ss_map.get(var, 1.0) for var in full_variables}
-    # Provide steady-state constants even if they are not in the endogenous set.
-    values.update(ss_map)
+    # Flat state vector over the full variable set, steady-state constants and shocks,
+    # then lag/lead slots that copy the contemporaneous values. Unknown variables are 1.
+    index: dict[str, int] = {}
+    for name in [*full_variables, *ss_map, *shocks]:
+        index.setdefault(name, len(index))
+    var_pos = [index[var] for var in full_variables]
+    lag_pos = [index.setdefault(_lag_name(var), len(index)) for var in full_variables]
+    lead_pos = [index.setdefault(_lead_name(var), len(index)) for var in full_variables]
+    state = np.ones(len(index))
+    for name, value in ss_map.items():
+        state[index[name]] = value
     for shock in shocks:
-        values[shock] = ss_map.get(shock, 0.0)
-
-    # Add lag/lead values for evaluation.
-    for var in list(full_variables):
-        values[_lag_name(var)] = values[var]
-        values[_lead_name(var)] = values[var]
+        state[index[shock]] = ss_map.get(shock, 0.0)
+    state[lag_pos] = state[var_pos]
+    state[lead_pos] = state[var_pos]
 
     eps = 1e-6
-    # Drop equations that fail to evaluate at the steady state baseline.
-    eval_ok_funcs = []
+    # Drop equations that fail to evaluate at the steady state baseline. The state is
+    # float64 and the env uses NumPy math, so domain errors would otherwise surface as
+    # nan/inf with a warning: raise them, and treat a non-finite value as an error too.
+    # Underflow to zero is left alone, as with the math module.
     eval_ok_ids = []
+    eval_ok_residuals = []
     eval_skipped = []
-    for func, eq_id in zip(funcs, ids):
-        try:
-            _ = func(values)
-            eval_ok_funcs.append(func)
-            eval_ok_ids.append(eq_id)
-        except Exception as exc:  # pragma: no cover - defensive
-            eval_skipped.append({"id": eq_id, "reason": f"eval_error:{type(exc).__name__}"})
+    with np.errstate(divide="raise", invalid="raise", over="raise"):
+        for eq_id, expr in zip(ids, residuals):
+            try:
+                func = _compile_residual_function(expr, env, index)
+                if not np.isfinite(func(state)):
+                    raise FloatingPointError("non-finite residual at steady state")
+                eval_ok_ids.append(eq_id)
+                eval_ok_residuals.append(expr)
+            except Exception as exc:  # pragma: no cover - defensive
+                eval_skipped.append({"id": eq_id, "reason": f"eval_error:{type(exc).__name__}"})
 
-    funcs = eval_ok_funcs
     ids = eval_ok_ids
 
     allowed_skip_reasons = {"indexed_or_integral"}
@@ -511,71 +744,79 @@ def main() -> None:
             + json.dumps(unexpected_skips, indent=2)
         )
 
-    g0 = _numeric_jacobian(funcs, values, variables, eps=eps)
-    g1 = _numeric_jacobian(funcs, values, [_lag_name(v) for v in variables], eps=eps)
-    pi = _numeric_jacobian(funcs, values, [_lead_name(v) for v in variables], eps=eps)
-    psi = _numeric_jacobian(funcs, values, shocks, eps=eps) if shocks else np.zeros((len(funcs), 0))
+    # Read Jacobian rows of affine residuals off their coefficients; the rest go
+    # through one compiled kernel over a flat state vector.
+    linear_rows: list[int] = []
+    linear_coeffs: list[dict[int, float]] = []
+    nonlinear_rows: list[int] = []
+    for row, expr in enumerate(eval_ok_residuals):
+        coeffs = _linear_coefficients(expr, env, index)
+        if coeffs is None:
+            nonlinear_rows.append(row)
+        else:
+            linear_rows.append(row)
+            linear_coeffs.append(coeffs)
+
+    # One fused Jacobian over [variables | lags | leads | shocks], sliced into blocks.
+    n_var = len(variables)
+    cols = (
+        [index[v] for v in variables]
+        + [index[_lag_name(v)] for v in variables]
+        + [index[_lead_name(v)] for v in variables]
+        + [index[s] for s in shocks]
+    )
+    jac = np.zeros((len(eval_ok_residuals), len(cols)))
+    col_of = {pos: j for j, pos in enumerate(cols)}
+    for row, coeffs in zip(linear_rows, linear_coeffs):
+        for pos, coef in coeffs.items():
+            j = col_of.get(pos)
+            if j is not None:
+                jac[row, j] = coef
+    if nonlinear_rows:
+        kernel = _compile_residual_kernel(
+            [eval_ok_residuals[row] for row in nonlinear_rows], env, index
+        )
+        jac[nonlinear_rows] = _numeric_jacobian(kernel, state, cols, eps=eps)
 
     # Drop equations that generate non-finite Jacobian entries.
-    finite_mask = (
-        np.isfinite(g0).all(axis=1)
-        & np.isfinite(g1).all(axis=1)
-        & np.isfinite(pi).all(axis=1)
-        & np.isfinite(psi).all(axis=1)
-    )
+    finite_mask = np.isfinite(jac).all(axis=1)
     dropped_nonfinite = [eq_id for eq_id, keep in zip(ids, finite_mask) if not keep]
     if not finite_mask.all():
-        g0 = g0[finite_mask, :]
-        g1 = g1[finite_mask, :]
-        pi = pi[finite_mask, :]
-        psi = psi[finite_mask, :]
+        jac = jac[finite_mask, :]
         ids = [eq_id for eq_id, keep in zip(ids, finite_mask) if keep]
-        funcs = [func for func, keep in zip(funcs, finite_mask) if keep]
+    equation_count = len(ids)
 
     # Select a square subset of equations/variables if needed.
-    selected_rows = list(range(g0.shape[0]))
-    selected_cols = list(range(g0.shape[1]))
-    m, n = g0.shape
+    selected_rows = list(range(jac.shape[0]))
+    selected_cols = list(range(n_var))
+    m, n = jac.shape[0], n_var
     selection_note = "none"
-    if allowlist_note:
-        if m < n:
-            raise RuntimeError(
-                "Endogenous allowlist produces underdetermined system: "
-                f"equations={m}, variables={n}."
-            )
-        if m > n:
-            M = np.hstack([g0, g1, pi])
-            _, _, piv = qr(M.T, pivoting=True, mode="economic")
-            selected_rows = sorted(piv[:n].tolist())
-            g0 = g0[selected_rows, :]
-            g1 = g1[selected_rows, :]
-            pi = pi[selected_rows, :]
-            psi = psi[selected_rows, :]
-            ids = [ids[i] for i in selected_rows]
-            selection_note = "allowlist_row_pivot"
-        else:
-            selection_note = "allowlist"
-    elif m > n:
-        M = np.hstack([g0, g1, pi])
-        _, _, piv = qr(M.T, pivoting=True, mode="economic")
+    if allowlist_note and m < n:
+        raise RuntimeError(
+            "Endogenous allowlist produces underdetermined system: "
+            f"equations={m}, variables={n}."
+        )
+    if m > n:
+        # g0 | g1 | pi are adjacent column blocks of jac, so pivot on them without stacking.
+        _, _, piv = qr(jac[:, : 3 * n].T, pivoting=True, mode="economic")
         selected_rows = sorted(piv[:n].tolist())
-        g0 = g0[selected_rows, :]
-        g1 = g1[selected_rows, :]
-        pi = pi[selected_rows, :]
-        psi = psi[selected_rows, :]
+        jac = jac[selected_rows, :]
         ids = [ids[i] for i in selected_rows]
-        selection_note = "row_pivot"
+        selection_note = "allowlist_row_pivot" if allowlist_note else "row_pivot"
+    elif allowlist_note:
+        selection_note = "allowlist"
     elif m < n:
         # Use column pivoting on g0 to select a square system.
-        _, _, piv = qr(g0, pivoting=True, mode="economic")
+        _, _, piv = qr(jac[:, :n], pivoting=True, mode="economic")
         selected_cols = sorted(piv[:m].tolist())
-        g0 = g0[:, selected_cols]
-        g1 = g1[:, selected_cols]
-        pi = pi[:, selected_cols]
+        sel = np.asarray(selected_cols, dtype=np.intp)
+        jac = jac[:, np.concatenate([sel, n + sel, 2 * n + sel, np.arange(3 * n, jac.shape[1])])]
         variables = [variables[i] for i in selected_cols]
         selection_note = "col_pivot"
+    n_sel = len(selected_cols)
+    g0, g1, pi, psi = np.split(jac, [n_sel, 2 * n_sel, 3 * n_sel], axis=1)
 
-    np.savez_compressed(
+    np.savez(
         MODEL_DIR / "linear_system.npz",
         g0=g0,
         g1=g1,
@@ -587,12 +828,12 @@ def main() -> None:
     )
 
     report = {
-        "equation_count": len(funcs),
+        "equation_count": equation_count,
         "variable_count": len(variables),
         "shock_count": len(shocks),
         "selected_rows": selected_rows,
         "selected_cols": selected_cols,
-        "used_section": sections,
+        "used_section": list(SECTIONS),
         "skipped_equations": skipped + eval_skipped,
         "dropped_nonfinite": dropped_nonfinite,
         "selection_note": selection_note,
@@ -6,6 +6,7 @@ from pathlib import Path
 import numpy as np
 
 from lv_fiscal_dsge.determinacy import check_determinacy
+from lv_fiscal_dsge.gensys import ordered_qz
 from lv_fiscal_dsge.irf import compute_irfs
 from lv_fiscal_dsge.solve import solve_linear_model
 
@@ -38,7 +39,14 @@ def main() -> None:
     variables = system.get("variables", np.array([], dtype=object)).tolist()
     shocks = system.get("shocks", np.array([], dtype=object)).tolist()
 
-    det = check_determinacy(g0, g1)
+    # Factor once and share the ordered QZ between the root count and the solver.
+    try:
+        qz = ordered_qz(g0, g1)
+    except (ValueError, np.linalg.LinAlgError):
+        # Fall back to eig for the root count; the solver reports the QZ failure below.
+        qz = None
+
+    det = check_determinacy(g0, g1, qz=qz)
     report = {
         "stable_roots": det.stable,
         "unstable_roots": det.unstable,
@@ -46,7 +54,7 @@ def main() -> None:
     }
 
     try:
-        sol = solve_linear_model(g0, g1, c=c, psi=psi, pi=pi)
+        sol = solve_linear_model(g0, g1, c=c, psi=psi, pi=pi, qz=qz)
     except Exception as exc:
         report["solve_error"] = f"{type(exc).__name__}: {exc}"
         (DOCS_DIR / "determinacy_report.json").write_text(
@@ -64,7 +72,7 @@ def main() -> None:
 
     horizon = 40
     responses = compute_irfs(sol.G1, sol.impact, horizon=horizon)
-    np.savez_compressed(
+    np.savez(
         DOCS_DIR / "irf_results.npz",
         responses=responses,
         variables=np.array(variables, dtype=object),
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+# Repository layout is fixed (src/lv_fiscal_dsge/_paths.py), so derive the root
+# lexically instead of resolving each path component on the filesystem.
+ROOT = Path(os.path.abspath(__file__)).parents[2]
+MODEL_DIR = ROOT / "model"
+DOCS_DIR = ROOT / "docs"
+
+
+def cache_dir() -> Path | None:
+    """Per-user cache for derived data, or ``None`` when no location can be resolved.
+
+    Resolved on each call so ``DSGE_CACHE_DIR`` can be changed at runtime; the cache is
+    never written inside the source tree.
+    """
+    override = os.environ.get("DSGE_CACHE_DIR")
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME")
+    if not base:
+        try:
+            base = Path.home() / ".cache"
+        except (KeyError, RuntimeError):
+            # No HOME and no passwd entry: run without a cache.
+            return None
+    return Path(base) / "lv_fiscal_dsge"
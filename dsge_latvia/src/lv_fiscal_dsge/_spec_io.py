@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import sys
+from typing import Any, Iterator
+
+from lv_fiscal_dsge._paths import MODEL_DIR
+from lv_fiscal_dsge._yaml_io import load_yaml
+
+# spec.yaml sections that hold equation entries, in model order.
+SECTIONS = (
+    "equations",
+    "fiscal_rule_equations",
+    "appendix_a_equations",
+    "appendix_c_normalization",
+    "appendix_c_functional_forms",
+    "appendix_c_normalized_model",
+    "shock_processes",
+    "foreign_block_equations",
+    "measurement_equations",
+)
+
+# Every parameter file whose keys count as parameter names in equations.
+PARAMETER_FILES = (
+    "parameters_fiscal_calibrated.yaml",
+    "parameters_nonfiscal_calibrated.yaml",
+    "parameters_fiscal_estimated.yaml",
+    "parameters_nonfiscal_estimated.yaml",
+    "parameters_foreign_estimated.yaml",
+)
+
+
+def iter_equation_entries(spec: dict[str, Any]) -> Iterator[tuple[str, str, str, dict[str, Any]]]:
+    """Yield ``(section, eq_id, raw, entry)`` for every equation with an id and raw text.
+
+    Assumes ``spec`` has the shape checked by ``model_spec._validate_spec``.
+    """
+    for section in SECTIONS:
+        entries = spec.get(section)
+        if not entries:
+            continue
+        for entry in entries:
+            entry_get = entry.get
+            raw = entry_get("raw")
+            eq_id = entry_get("id")
+            if not raw or not eq_id:
+                continue
+            yield section, str(eq_id), str(raw), entry
+
+
+def collect_parameter_names() -> set[str]:
+    names: set[str] = set()
+    for name in PARAMETER_FILES:
+        path = MODEL_DIR / name
+        if not path.exists():
+            continue
+        data = load_yaml(path)
+        if isinstance(data, dict):
+            # YAML allows non-string keys (bare 1:, true:); name them by their text.
+            names.update(sys.intern(str(key)) for key in data)
+    return names
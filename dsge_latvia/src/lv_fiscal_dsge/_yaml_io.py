@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+# Parsed documents keyed by path, tagged with the mtime they were read at.
+_YAML_CACHE: dict[str, tuple[int, Any]] = {}
+
+
+@lru_cache(maxsize=1)
+def _yaml_loader() -> tuple[Any, Any]:
+    # Imported on first parse: warm callers served from the cache never load pyyaml.
+    try:
+        import yaml
+    except ImportError:  # pragma: no cover - soft dependency
+        return None, None
+    # libyaml's C loader when available; same safe semantics as yaml.safe_load.
+    return yaml, getattr(yaml, "CSafeLoader", None) or yaml.SafeLoader
+
+
+def load_yaml(path: Path) -> Any:
+    """Parse a YAML file, reusing the previous result while its mtime is unchanged.
+
+    Callers share the returned object and must not mutate it.
+    """
+    key = str(path)
+    mtime_ns = path.stat().st_mtime_ns
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    yaml, loader = _yaml_loader()
+    if yaml is None:
+        raise RuntimeError("pyyaml is required to load model YAML files")
+    with path.open("r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=loader)
+    _YAML_CACHE[key] = (mtime_ns, data)
+    return data
+
+
+def _clear_yaml_cache() -> None:
+    _YAML_CACHE.clear()
@@ -6,6 +6,8 @@ import numpy as np
 from numpy.typing import NDArray
 from scipy.linalg import eig
 
+from lv_fiscal_dsge.gensys import QZDecomposition
+
 
 @dataclass
 class DeterminacyResult:
@@ -14,8 +16,19 @@ class DeterminacyResult:
     eigenvalues: NDArray[np.complex128]
 
 
-def check_determinacy(g0: NDArray[np.float64], g1: NDArray[np.float64], div: float = 1.0000001) -> DeterminacyResult:
-    eigvals = eig(g0, g1, right=False)
-    unstable = int(np.sum(np.abs(eigvals) > div))
-    stable = int(len(eigvals) - unstable)
+def check_determinacy(
+    g0: NDArray[np.float64],
+    g1: NDArray[np.float64],
+    div: float = 1.0000001,
+    qz: QZDecomposition | None = None,
+) -> DeterminacyResult:
+    # Compare |alpha| against div * |beta| so infinite roots (beta == 0) need no division.
+    if qz is not None:
+        alpha, beta = qz[2], qz[3]
+    else:
+        alpha, beta = eig(g0, g1, right=False, homogeneous_eigvals=True)
+    unstable = int(np.sum(np.abs(alpha) > div * np.abs(beta)))
+    stable = int(len(alpha) - unstable)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        eigvals = alpha / beta
     return DeterminacyResult(stable=stable, unstable=unstable, eigenvalues=eigvals)
@@ -4,13 +4,64 @@ from typing import Any
 
 import numpy as np
 from numpy.typing import NDArray
-from scipy.linalg import ordqz
+from scipy.linalg import ordqz, qr, solve, solve_triangular
 
 
 class GensysNotImplementedError(RuntimeError):
     pass
 
 
+# (S, T, alpha, beta, Q, Z) as returned by scipy.linalg.ordqz.
+QZDecomposition = tuple[
+    NDArray[np.float64],
+    NDArray[np.float64],
+    NDArray[np.complex128],
+    NDArray[np.float64],
+    NDArray[np.float64],
+    NDArray[np.float64],
+]
+
+
+def ordered_qz(
+    g0: NDArray[np.float64],
+    g1: NDArray[np.float64],
+    div: float | None = None,
+) -> QZDecomposition:
+    """Generalized Schur form of (g0, g1) with roots inside ``div`` ordered first."""
+    if div is None:
+        div = 1.0000001
+
+    def _select(alpha: np.ndarray, beta: np.ndarray) -> np.ndarray:
+        alpha_arr = np.asarray(alpha)
+        beta_arr = np.asarray(beta)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.abs(
+                np.divide(alpha_arr, beta_arr, out=np.full_like(alpha_arr, np.inf), where=beta_arr != 0)
+            )
+        return ratio < div
+
+    g0 = np.atleast_2d(np.asarray(g0, dtype=float))
+    g1 = np.atleast_2d(np.asarray(g1, dtype=float))
+    return ordqz(g0, g1, sort=_select)
+
+
+def _rank(a: NDArray[np.float64]) -> int:
+    # Rank from a pivoted QR: |diag(R)| is non-increasing and |R[0, 0]| is the largest entry.
+    r = qr(a, mode="r", pivoting=True)[0]
+    diag = np.abs(np.diag(r))
+    if diag.size == 0:
+        return 0
+    tol = max(a.shape) * np.finfo(float).eps * diag[0]
+    return int(np.sum(diag > tol))
+
+
+def _solve_upper(s11: NDArray[np.float64], rhs: NDArray[np.float64]) -> NDArray[np.float64]:
+    # The real QZ form is only quasi-triangular: complex pairs leave 2x2 blocks on the diagonal.
+    if not np.any(np.diag(s11, -1)):
+        return solve_triangular(s11, rhs, lower=False)
+    return solve(s11, rhs)
+
+
 def gensys(
     g0: NDArray[np.float64],
     g1: NDArray[np.float64],
@@ -18,12 +69,15 @@ def gensys(
     psi: NDArray[np.float64] | None,
     pi: NDArray[np.float64] | None,
     div: float | None = None,
+    qz: QZDecomposition | None = None,
 ) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64], tuple[int, int]]:
     """
     Sims (2001) gensys solver.
 
     System: g0 * x_t = g1 * x_{t-1} + c + psi * eps_t + pi * eta_t
     Returns: (G1, C, impact, eu)
+
+    Pass ``qz`` from ``ordered_qz`` (same ``div``) to reuse an existing factorization.
     """
     if div is None:
         div = 1.0000001
@@ -46,18 +100,8 @@ def gensys(
         pi = np.zeros((n, 0))
     pi = np.atleast_2d(np.asarray(pi, dtype=float))
 
-    def _select(alpha: np.ndarray, beta: np.ndarray) -> np.ndarray:
-        alpha_arr = np.asarray(alpha)
-        beta_arr = np.asarray(beta)
-        with np.errstate(divide="ignore", invalid="ignore"):
-            ratio = np.abs(
-                np.divide(alpha_arr, beta_arr, out=np.full_like(alpha_arr, np.inf), where=beta_arr != 0)
-            )
-        return ratio < div
-
-    s, t, alpha, beta, q, z = ordqz(g0, g1, sort=_select)
-    eigval = alpha / beta
-    nstable = int(np.sum(np.abs(eigval) < div))
+    s, t, alpha, beta, q, z = qz if qz is not None else ordered_qz(g0, g1, div=div)
+    nstable = int(np.sum(np.abs(alpha) < div * np.abs(beta)))
     nunstable = n - nstable
 
     # Partition matrices (stable eigenvalues first)
@@ -73,7 +117,7 @@ def gensys(
     eu_unique = 1
     if nunstable > 0:
         q2pi = q2 @ pi
-        rank_q2pi = np.linalg.matrix_rank(q2pi) if q2pi.size else 0
+        rank_q2pi = _rank(q2pi) if q2pi.size else 0
         if rank_q2pi < nunstable:
             eu_exist = 0
             eu_unique = 0
@@ -90,22 +134,15 @@ def gensys(
         impact = np.zeros((n, psi.shape[1]))
         return G1, C, impact, (eu_exist, eu_unique)
 
-    # Solve for stable block.
-    s11_inv = np.linalg.inv(s11)
-    Zinv = np.linalg.inv(z)
-
-    G1_stable = s11_inv @ t11
-    G1_block = np.block(
-        [
-            [G1_stable, s11_inv @ t12],
-            [np.zeros((nunstable, nstable)), np.eye(nunstable)],
-        ]
-    )
-    G1 = z @ G1_block @ Zinv
-
-    c_block = np.vstack([s11_inv @ (q1 @ c), np.zeros((nunstable, 1))])
-    psi_block = np.vstack([s11_inv @ (q1 @ psi), np.zeros((nunstable, psi.shape[1]))])
-    C = z @ c_block
-    impact = z @ psi_block
+    # Solve for stable block: one solve against all right-hand sides; z is orthogonal.
+    # The result fills the top rows of [G1_block | c_block | psi_block], written in place.
+    blocks = np.zeros((n, n + 1 + psi.shape[1]))
+    blocks[:nstable] = _solve_upper(s11, np.hstack([t11, t12, q1 @ c, q1 @ psi]))
+    np.fill_diagonal(blocks[nstable:, nstable:n], 1.0)
+
+    z_blocks = z @ blocks
+    G1 = z_blocks[:, :n] @ z.conj().T
+    C = z_blocks[:, n : n + 1]
+    impact = z_blocks[:, n + 1 :]
 
     return G1, C, impact, (eu_exist, eu_unique)
@@ -25,11 +25,19 @@ def compute_irfs(
     if shock_sizes is None:
         shock_sizes = np.ones((n_shocks,))
     shock_sizes = np.asarray(shock_sizes, dtype=float).reshape((n_shocks,))
-    responses = np.zeros((n_vars, horizon + 1, n_shocks))
-
-    for j in range(n_shocks):
-        responses[:, 0, j] = impact[:, j] * shock_sizes[j]
-        for t in range(1, horizon + 1):
-            responses[:, t, j] = g1 @ responses[:, t - 1, j]
-
-    return responses
+    # Time-major buffer so each step is one contiguous (n_vars, n_shocks) block.
+    paths = np.empty((horizon + 1, n_vars, n_shocks))
+    paths[0] = impact * shock_sizes[None, :]
+
+    # Doubling: with `power` = g1**filled, one batched matmul extends the
+    # first `filled` steps to the next `filled` ones.
+    filled = 1
+    power = g1
+    while filled <= horizon:
+        step = min(filled, horizon + 1 - filled)
+        np.matmul(power, paths[:step], out=paths[filled : filled + step])
+        filled += step
+        if filled <= horizon:
+            power = power @ power
+
+    return np.ascontiguousarray(paths.transpose(1, 0, 2))
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
+import copy
 import re
+import sys
 
-try:
-    import yaml
-except Exception as exc:  # pragma: no cover - soft dependency
-    yaml = None
+from lv_fiscal_dsge._paths import MODEL_DIR
+from lv_fiscal_dsge._spec_io import SECTIONS as _SECTIONS
+from lv_fiscal_dsge._spec_io import collect_parameter_names as _collect_parameter_names
+from lv_fiscal_dsge._spec_io import iter_equation_entries as _iter_equation_entries
+from lv_fiscal_dsge._yaml_io import load_yaml as _load_yaml
 
 
 @dataclass
@@ -22,26 +25,70 @@ class Equation:
     notes: str | None = None
 
 
+class _LazyField:
+    """Dataclass field default that is computed from the instance on first read.
+
+    Passing a value to ``__init__`` stores it as-is; leaving the field as ``None``
+    defers ``load(instance)`` until the attribute (or ``asdict``/``repr``/``==``)
+    reads it.
+    """
+
+    def __init__(self, load: Callable[[Any], Any]) -> None:
+        self._load = load
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._slot = f"_{name}"
+
+    def __get__(self, obj: Any, objtype: type | None = None) -> Any:
+        if obj is None:
+            # Queried by @dataclass for the field default.
+            return None
+        value = obj.__dict__.get(self._slot)
+        if value is None:
+            value = obj.__dict__[self._slot] = self._load(obj)
+        return value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        obj.__dict__[self._slot] = value
+
+
+def _spec_symbols(spec: ModelSpec) -> tuple[list[str], list[str]]:
+    cached = spec.__dict__.get("_symbols")
+    if cached is None:
+        cached = spec.__dict__["_symbols"] = _extract_symbols(
+            spec.equations, _collect_parameter_names()
+        )
+    return cached
+
+
 @dataclass
 class ModelSpec:
+    """Parsed model specification.
+
+    ``variables``, ``shocks`` and ``parameters`` may be left as ``None``; they are then
+    loaded on first access, so callers that only inspect equations or observables skip
+    the parameter YAML files.
+    """
+
     name: str
-    variables: list[str]
-    shocks: list[str]
-    parameters: dict[str, float]
-    equations: list[Equation]
-    observables: dict[str, list[str]]
+    variables: list[str] | None = _LazyField(lambda spec: _spec_symbols(spec)[0])
+    shocks: list[str] | None = _LazyField(lambda spec: _spec_symbols(spec)[1])
+    parameters: dict[str, float] | None = _LazyField(
+        lambda spec: load_parameters(list(SPEC_PARAMETER_FILES))
+    )
+    equations: list[Equation] = field(default_factory=list)
+    observables: dict[str, list[str]] = field(default_factory=dict)
     sources: dict[str, Any] | None = None
 
 
-ROOT = Path(__file__).resolve().parents[2]
-MODEL_DIR = ROOT / "model"
+# Calibrated parameter files that make up ModelSpec.parameters.
+SPEC_PARAMETER_FILES = (
+    MODEL_DIR / "parameters_fiscal_calibrated.yaml",
+    MODEL_DIR / "parameters_nonfiscal_calibrated.yaml",
+)
 
-
-def _load_yaml(path: Path) -> Any:
-    if yaml is None:
-        raise RuntimeError("pyyaml is required to load model YAML files")
-    with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+# Last spec object that passed _validate_spec; held so a re-parse is revalidated.
+_validated_spec: dict[str, Any] | None = None
 
 
 def load_parameters(paths: list[Path]) -> dict[str, float]:
@@ -55,31 +102,28 @@ def load_parameters(paths: list[Path]) -> dict[str, float]:
 
 
 def load_observables() -> dict[str, list[str]]:
-    return _load_yaml(MODEL_DIR / "observables.yaml")
+    # The YAML cache shares its parsed object; hand callers their own copy.
+    return copy.deepcopy(_load_yaml(MODEL_DIR / "observables.yaml"))
+
 
+def load_spec_cached() -> dict[str, Any]:
+    """Parsed spec.yaml, shared by every caller until the file changes on disk.
 
-def _load_spec_yaml() -> dict[str, Any]:
+    The section layout is validated once per parse; ``python -O`` skips the check.
+    """
+    global _validated_spec
     data = _load_yaml(MODEL_DIR / "spec.yaml")
     if not isinstance(data, dict):
         raise ValueError("spec.yaml must be a mapping")
+    if __debug__ and data is not _validated_spec:
+        _validate_spec(data)
+        _validated_spec = data
     return data
 
 
-def _collect_equations(spec: dict[str, Any]) -> list[Equation]:
-    sections = [
-        "equations",
-        "fiscal_rule_equations",
-        "appendix_a_equations",
-        "appendix_c_normalization",
-        "appendix_c_functional_forms",
-        "appendix_c_normalized_model",
-        "shock_processes",
-        "foreign_block_equations",
-        "measurement_equations",
-    ]
-    collected: list[Equation] = []
-    for section in sections:
-        entries = spec.get(section, [])
+def _validate_spec(spec: dict[str, Any]) -> None:
+    for section in _SECTIONS:
+        entries = spec.get(section)
         if not entries:
             continue
         if not isinstance(entries, list):
@@ -87,43 +131,29 @@ def _collect_equations(spec: dict[str, Any]) -> list[Equation]:
         for entry in entries:
             if not isinstance(entry, dict):
                 raise ValueError(f"{section} entries must be mappings")
-            raw = entry.get("raw")
-            eq_id = entry.get("id")
-            if not raw or not eq_id:
-                continue
-            collected.append(
-                Equation(
-                    eq_id=str(eq_id),
-                    raw=str(raw),
-                    source=entry.get("source"),
-                    name=entry.get("name"),
-                    notes=entry.get("notes"),
-                    section=section,
-                )
-            )
-    return collected
 
 
-def _collect_parameter_names() -> set[str]:
-    names: set[str] = set()
-    for name in (
-        "parameters_fiscal_calibrated.yaml",
-        "parameters_nonfiscal_calibrated.yaml",
-        "parameters_fiscal_estimated.yaml",
-        "parameters_nonfiscal_estimated.yaml",
-        "parameters_foreign_estimated.yaml",
-    ):
-        path = MODEL_DIR / name
-        if not path.exists():
-            continue
-        data = _load_yaml(path)
-        if isinstance(data, dict):
-            names.update(data.keys())
-    return names
+def _collect_equations(spec: dict[str, Any]) -> list[Equation]:
+    collected: list[Equation] = []
+    append = collected.append
+    for section, eq_id, raw, entry in _iter_equation_entries(spec):
+        entry_get = entry.get
+        append(
+            Equation(
+                eq_id=eq_id,
+                raw=raw,
+                source=entry_get("source"),
+                name=entry_get("name"),
+                notes=entry_get("notes"),
+                section=section,
+            )
+        )
+    return collected
 
 
-def _extract_symbols(equations: list[Equation], param_names: set[str]) -> tuple[list[str], list[str]]:
-    reserved = {
+# Names that appear in equations but are operators or functions, not model symbols.
+_RESERVED = frozenset(
+    {
         "E_t",
         "E",
         "exp",
@@ -140,40 +170,39 @@ def _extract_symbols(equations: list[Equation], param_names: set[str]) -> tuple[
         "S_tilde_double_prime",
         "pi",
     }
-    token_re = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+)
+
+# One scan per equation: shock names (eps_*, e_me_*) match the first group, any other
+# identifier the second.
+_SYMBOL_RE = re.compile(
+    r"(?P<shock>\b(?:eps|e_me)_[A-Za-z0-9_]*\b)|(?P<tok>[A-Za-z_][A-Za-z0-9_]*)"
+)
+
+
+def _extract_symbols(equations: list[Equation], param_names: set[str]) -> tuple[list[str], list[str]]:
     tokens: set[str] = set()
     shock_tokens: set[str] = set()
+    add_token = tokens.add
+    add_shock = shock_tokens.add
+    finditer = _SYMBOL_RE.finditer
+    intern = sys.intern
     for eq in equations:
-        for token in token_re.findall(eq.raw):
-            tokens.add(token)
-        for match in re.findall(r"\beps_[A-Za-z0-9_]*\b", eq.raw):
-            shock_tokens.add(match)
-        for match in re.findall(r"\be_me_[A-Za-z0-9_]*\b", eq.raw):
-            shock_tokens.add(match)
-    variables = sorted(t for t in tokens if t not in reserved and t not in param_names)
-    shocks = sorted(t for t in shock_tokens if t not in param_names)
+        for match in finditer(eq.raw):
+            # Interned tokens compare by identity against the interned parameter names.
+            token = intern(match.group())
+            add_token(token)
+            if match.lastgroup == "shock":
+                add_shock(token)
+    variables = sorted(tokens - (_RESERVED | param_names))
+    shocks = sorted(shock_tokens - param_names)
     return variables, shocks
 
 
 def build_spec() -> ModelSpec:
-    params = load_parameters(
-        [
-            MODEL_DIR / "parameters_fiscal_calibrated.yaml",
-            MODEL_DIR / "parameters_nonfiscal_calibrated.yaml",
-        ]
-    )
-    observables = load_observables()
-    spec_yaml = _load_spec_yaml()
-    equations = _collect_equations(spec_yaml)
-    param_names = _collect_parameter_names()
-    variables, shocks = _extract_symbols(equations, param_names)
-
+    spec_yaml = load_spec_cached()
     return ModelSpec(
         name=spec_yaml.get("name", "Latvia Fiscal DSGE"),
-        variables=variables,
-        shocks=shocks,
-        parameters=params,
-        equations=equations,
-        observables=observables,
-        sources=spec_yaml.get("source"),
+        equations=_collect_equations(spec_yaml),
+        observables=load_observables(),
+        sources=copy.deepcopy(spec_yaml.get("source")),
     )
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from pathlib import Path
+from functools import lru_cache
 from typing import Any
 
 import re
-import yaml
+import sys
 
-
-ROOT = Path(__file__).resolve().parents[2]
-MODEL_DIR = ROOT / "model"
+from lv_fiscal_dsge._paths import MODEL_DIR
+from lv_fiscal_dsge._spec_io import collect_parameter_names as _collect_parameter_names
+from lv_fiscal_dsge._spec_io import iter_equation_entries as _iter_equation_entries
+from lv_fiscal_dsge._yaml_io import load_yaml as _load_yaml
+from lv_fiscal_dsge.model_spec import load_spec_cached
 
 
 @dataclass
@@ -22,36 +24,6 @@ class ParamIssue:
     sections: list[str]
 
 
-def _load_yaml(path: Path) -> Any:
-    with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
-
-
-def _load_spec() -> dict[str, Any]:
-    data = _load_yaml(MODEL_DIR / "spec.yaml")
-    if not isinstance(data, dict):
-        raise ValueError("spec.yaml must be a mapping")
-    return data
-
-
-def _load_param_values() -> set[str]:
-    names: set[str] = set()
-    for name in (
-        "parameters_fiscal_calibrated.yaml",
-        "parameters_nonfiscal_calibrated.yaml",
-        "parameters_fiscal_estimated.yaml",
-        "parameters_nonfiscal_estimated.yaml",
-        "parameters_foreign_estimated.yaml",
-    ):
-        path = MODEL_DIR / name
-        if not path.exists():
-            continue
-        data = _load_yaml(path)
-        if isinstance(data, dict):
-            names.update(data.keys())
-    return names
-
-
 def _load_registry() -> dict[str, Any]:
     path = MODEL_DIR / "parameter_registry.yaml"
     if not path.exists():
@@ -59,54 +31,42 @@ def _load_registry() -> dict[str, Any]:
     data = _load_yaml(path)
     if not isinstance(data, dict):
         raise ValueError("parameter_registry.yaml must be a mapping")
-    return data
+    return {sys.intern(str(name)): meta for name, meta in data.items()}
 
 
 def _collect_equation_refs(spec: dict[str, Any]) -> dict[str, tuple[str, str]]:
-    sections = [
-        "equations",
-        "fiscal_rule_equations",
-        "appendix_a_equations",
-        "appendix_c_normalization",
-        "appendix_c_functional_forms",
-        "appendix_c_normalized_model",
-        "shock_processes",
-        "foreign_block_equations",
-        "measurement_equations",
-    ]
-    refs: dict[str, tuple[str, str]] = {}
-    for section in sections:
-        entries = spec.get(section, []) or []
-        if not isinstance(entries, list):
-            continue
-        for entry in entries:
-            if not isinstance(entry, dict):
-                continue
-            eq_id = entry.get("id")
-            raw = entry.get("raw")
-            if eq_id and raw:
-                refs[str(eq_id)] = (section, str(raw))
-    return refs
-
-
-def _find_param_usage(equation_text: str, param_names: set[str]) -> set[str]:
-    tokens = re.findall(r"[A-Za-z_][A-Za-z0-9_]*", equation_text)
-    return {t for t in tokens if t in param_names}
+    return {eq_id: (section, raw) for section, eq_id, raw, _ in _iter_equation_entries(spec)}
+
+
+_TOKEN_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+@lru_cache(maxsize=4096)
+def _equation_tokens(equation_text: str) -> frozenset[str]:
+    return frozenset(sys.intern(m.group()) for m in _TOKEN_RE.finditer(equation_text))
+
+
+def _find_param_usage(equation_text: str, param_names: frozenset[str]) -> frozenset[str]:
+    # Tokenization depends only on the text, so repeated equations and audits reuse it.
+    return _equation_tokens(equation_text) & param_names
 
 
 def build_param_issues() -> tuple[list[ParamIssue], list[str]]:
-    spec = _load_spec()
+    spec = load_spec_cached()
     registry = _load_registry()
-    param_values = _load_param_values()
+    param_values = _collect_parameter_names()
     eq_refs = _collect_equation_refs(spec)
 
     # Build reverse index: parameter -> equations
-    param_to_eqs: dict[str, set[str]] = {}
+    all_params = frozenset(param_values | registry.keys())
+    # Equations are visited in eq_id order, so each parameter's equation list is
+    # already sorted (and duplicate-free, since eq_ids are unique).
+    param_to_eqs: dict[str, list[str]] = {}
     param_to_sections: dict[str, set[str]] = {}
-    for eq_id, (section, raw) in eq_refs.items():
-        used = _find_param_usage(raw, param_values | registry.keys())
+    for eq_id, (section, raw) in sorted(eq_refs.items()):
+        used = _find_param_usage(raw, all_params)
         for param in used:
-            param_to_eqs.setdefault(param, set()).add(eq_id)
+            param_to_eqs.setdefault(param, []).append(eq_id)
             param_to_sections.setdefault(param, set()).add(section)
 
     issues: list[ParamIssue] = []
@@ -122,7 +82,7 @@ def build_param_issues() -> tuple[list[ParamIssue], list[str]]:
                     status=status,
                     source=meta.get("source"),
                     notes=meta.get("notes"),
-                    equations=sorted(param_to_eqs.get(name, set())),
+                    equations=param_to_eqs.get(name, []),
                     sections=sorted(param_to_sections.get(name, set())),
                 )
             )
@@ -6,7 +6,7 @@ from typing import Any
 import numpy as np
 from numpy.typing import NDArray
 
-from lv_fiscal_dsge.gensys import gensys
+from lv_fiscal_dsge.gensys import QZDecomposition, gensys
 
 
 @dataclass
@@ -28,6 +28,7 @@ def solve_linear_model(
     psi: NDArray[np.float64] | None = None,
     pi: NDArray[np.float64] | None = None,
     div: float | None = None,
+    qz: QZDecomposition | None = None,
 ) -> Solution:
-    G1, C, impact, eu = gensys(g0, g1, c, psi, pi, div=div)
+    G1, C, impact, eu = gensys(g0, g1, c, psi, pi, div=div, qz=qz)
     return Solution(G1=G1, C=C, impact=impact, eu=eu)
@@ -1,24 +1,30 @@
 from __future__ import annotations
 
+import copy
 import json
 from dataclasses import dataclass
-from pathlib import Path
-from typing import Any
+from heapq import nlargest
+from typing import Any, Iterable, Mapping
 
-import yaml
+try:
+    from joblib import Parallel, delayed
+except ImportError:  # pragma: no cover - optional accelerator
+    Parallel = delayed = None
 
+from lv_fiscal_dsge._paths import DOCS_DIR, MODEL_DIR
+from lv_fiscal_dsge._yaml_io import load_yaml
 from lv_fiscal_dsge.parameter_audit import build_param_issues
 from lv_fiscal_dsge.steady_state import (
-    compute_residuals,
+    RESIDUAL_NAMES,
+    ParamsView,
+    compute_residual_vector,
     compute_financial_frictions_metrics,
     load_parameters,
     solve_full_steady_state,
 )
 
 
-ROOT = Path(__file__).resolve().parents[2]
-MODEL_DIR = ROOT / "model"
-DOCS_DIR = ROOT / "docs"
+_WEDGE_INDEX = RESIDUAL_NAMES.index("resource_wedge")
 
 
 @dataclass
@@ -39,17 +45,19 @@ def _load_allowlist() -> dict[str, Any]:
     path = MODEL_DIR / "steady_state_allowlist.yaml"
     if not path.exists():
         return {"tolerance": 1.0e-10, "exempt_residuals": []}
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    data = load_yaml(path)
     if not isinstance(data, dict):
         raise ValueError("steady_state_allowlist.yaml must be a mapping")
-    return data
+    return copy.deepcopy(data)
 
 
-def evaluate_contract() -> ContractResult:
-    params = load_parameters()
+def evaluate_contract(params: Mapping[str, float] | None = None) -> ContractResult:
+    if params is None:
+        params = load_parameters()
     ss = solve_full_steady_state(params)
-    residuals = compute_residuals(ss, params)
-    metrics = compute_financial_frictions_metrics(ss, params)
+    view = ParamsView.from_dict(params)
+    metrics = compute_financial_frictions_metrics(ss, view)
+    values = compute_residual_vector(ss, view, out="scratch", metrics=metrics)
 
     allowlist = _load_allowlist()
     tolerance = float(allowlist.get("tolerance", 1.0e-10))
@@ -57,7 +65,7 @@ def evaluate_contract() -> ContractResult:
 
     exemptions: dict[str, float] = {}
     filtered: dict[str, float] = {}
-    for key, value in residuals.items():
+    for key, value in zip(RESIDUAL_NAMES, values.tolist()):
         if key in exempt_keys:
             exemptions[key] = value
         else:
@@ -70,7 +78,7 @@ def evaluate_contract() -> ContractResult:
         max_key = ""
         max_residual = 0.0
 
-    wedge_magnitude = float(abs(residuals.get("resource_wedge", 0.0)))
+    wedge_magnitude = float(abs(values[_WEDGE_INDEX]))
 
     invariants = {
         "omega_bar_positive": {
@@ -131,14 +139,24 @@ def evaluate_contract() -> ContractResult:
     )
 
 
+def evaluate_contract_batch(
+    param_sets: Iterable[Mapping[str, float]], n_jobs: int = -1
+) -> list[ContractResult]:
+    """Evaluate the contract for each parameter set, in parallel when joblib is installed."""
+    param_sets = [dict(params) for params in param_sets]
+    if Parallel is None or n_jobs == 1 or len(param_sets) < 2:
+        return [evaluate_contract(params) for params in param_sets]
+    return Parallel(n_jobs=n_jobs, backend="loky")(
+        delayed(evaluate_contract)(params) for params in param_sets
+    )
+
+
 def write_report(result: ContractResult) -> None:
     DOCS_DIR.mkdir(parents=True, exist_ok=True)
     report_path = DOCS_DIR / "steady_state_report.json"
 
-    sorted_res = sorted(
-        result.residuals.items(), key=lambda kv: abs(kv[1]), reverse=True
-    )
-    top = [{"name": k, "value": v} for k, v in sorted_res[:20]]
+    top_items = nlargest(20, result.residuals.items(), key=lambda kv: abs(kv[1]))
+    top = [{"name": k, "value": v} for k, v in top_items]
 
     payload = {
         "max_residual": result.max_residual,
@@ -152,6 +170,7 @@ def write_report(result: ContractResult) -> None:
         "invariant_failures": result.invariant_failures,
         "passed": result.passed,
     }
+    # json rather than orjson: a failing contract must report NaN/inf, not null.
     report_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
 
 
@@ -0,0 +1,15 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# The package is run from source (PYTHONPATH=src) rather than installed.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _isolated_cache_dir(tmp_path_factory):
+    # Keep load_parameters() from writing its snapshot into the user's cache.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("DSGE_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
+        yield
@@ -0,0 +1,52 @@
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "build_linear_system.py"
+_spec = importlib.util.spec_from_file_location("build_linear_system", _SCRIPT)
+bls = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(bls)
+
+_INDEX = {"x": 0, "y": 1, "z": 2}
+_ENV = {"a_c": 2.5, "b_c": 4.0, "log": np.log, "exp": np.exp}
+_STATE = np.array([0.3, -1.2, 0.7])
+
+
+def _finite_difference_row(expr):
+    kernel = bls._compile_residual_kernel([expr], _ENV, _INDEX)
+    cols = sorted(_INDEX.values())
+    return bls._numeric_jacobian(kernel, _STATE.copy(), cols, eps=1e-6)[0]
+
+
+def _dense(coeffs):
+    row = np.zeros(len(_INDEX))
+    for pos, coef in coeffs.items():
+        row[pos] = coef
+    return row
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "(x + y) - (z - 1.0)",
+        "-(x - 2.0 * y) + z",
+        "a_c * x - y * b_c",
+        "(x - y) / b_c + z / 2.0",
+        "log(a_c) * (x + exp(b_c) * y) / (a_c - b_c)",
+        "-(-x) / a_c - (y + z) * (b_c - 1.0)",
+    ],
+)
+def test_affine_rows_match_finite_differences(expr):
+    coeffs = bls._linear_coefficients(expr, _ENV, _INDEX)
+    assert coeffs is not None
+    np.testing.assert_allclose(_dense(coeffs), _finite_difference_row(expr), rtol=1e-7, atol=1e-8)
+
+
+@pytest.mark.parametrize(
+    "expr",
+    ["x * y - z", "x / y", "exp(x) - z", "a_c * x ** 2", "x / (b_c - 4.0)"],
+)
+def test_nonaffine_rows_fall_back_to_finite_differences(expr):
+    assert bls._linear_coefficients(expr, _ENV, _INDEX) is None
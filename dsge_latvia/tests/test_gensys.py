@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from lv_fiscal_dsge.gensys import gensys, ordered_qz
+
+
+def _random_system(seed: int, n: int = 8, n_shocks: int = 3, n_unstable: int = 2):
+    rng = np.random.default_rng(seed)
+    g0 = np.eye(n) + 0.1 * rng.standard_normal((n, n))
+    # The QZ eigenvalues alpha/beta are the reciprocals of these roots of g0^{-1} g1;
+    # n_unstable of them lie outside the unit circle, none near it.
+    roots = np.concatenate(
+        [rng.uniform(1.5, 3.0, n - n_unstable), rng.uniform(0.1, 0.8, n_unstable)]
+    )
+    basis = rng.standard_normal((n, n))
+    g1 = g0 @ basis @ np.diag(roots) @ np.linalg.inv(basis)
+    c = rng.standard_normal((n, 1))
+    psi = rng.standard_normal((n, n_shocks))
+    pi = rng.standard_normal((n, n_unstable))
+    return g0, g1, c, psi, pi
+
+
+def _inverse_solution(qz, c, psi, div=1.0000001):
+    # The explicit-inverse construction gensys used before the stacked solve.
+    s, t, alpha, beta, q, z = qz
+    n = s.shape[0]
+    nstable = int(np.sum(np.abs(alpha / beta) < div))
+    nunstable = n - nstable
+    s11_inv = np.linalg.inv(s[:nstable, :nstable])
+    q1 = q[:nstable, :]
+    G1_block = np.block(
+        [
+            [s11_inv @ t[:nstable, :nstable], s11_inv @ t[:nstable, nstable:]],
+            [np.zeros((nunstable, nstable)), np.eye(nunstable)],
+        ]
+    )
+    G1 = z @ G1_block @ np.linalg.inv(z)
+    C = z @ np.vstack([s11_inv @ (q1 @ c), np.zeros((nunstable, 1))])
+    impact = z @ np.vstack([s11_inv @ (q1 @ psi), np.zeros((nunstable, psi.shape[1]))])
+    return G1, C, impact
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_ordered_qz_factors_are_orthogonal(seed):
+    g0, g1, *_ = _random_system(seed)
+    s, t, alpha, beta, q, z = ordered_qz(g0, g1)
+    eye = np.eye(g0.shape[0])
+    np.testing.assert_allclose(q @ q.conj().T, eye, atol=1e-12)
+    np.testing.assert_allclose(z @ z.conj().T, eye, atol=1e-12)
+    np.testing.assert_allclose(q @ s @ z.conj().T, g0, atol=1e-12)
+    np.testing.assert_allclose(q @ t @ z.conj().T, g1, atol=1e-12)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_gensys_matches_inverse_solution(seed):
+    g0, g1, c, psi, pi = _random_system(seed)
+    qz = ordered_qz(g0, g1)
+    G1, C, impact, eu = gensys(g0, g1, c, psi, pi, qz=qz)
+    G1_ref, C_ref, impact_ref = _inverse_solution(qz, c, psi)
+    assert eu == (1, 1)
+    np.testing.assert_allclose(G1, G1_ref, rtol=1e-9, atol=1e-10)
+    np.testing.assert_allclose(C, C_ref, rtol=1e-9, atol=1e-10)
+    np.testing.assert_allclose(impact, impact_ref, rtol=1e-9, atol=1e-10)
+    # Computing the factorization inside gensys gives the same answer.
+    G1_own, C_own, impact_own, _ = gensys(g0, g1, c, psi, pi)
+    np.testing.assert_allclose(G1_own, G1, atol=1e-12)
+    np.testing.assert_allclose(C_own, C, atol=1e-12)
+    np.testing.assert_allclose(impact_own, impact, atol=1e-12)
@@ -0,0 +1,21 @@
+from lv_fiscal_dsge.model_spec import build_spec
+
+
+def test_build_spec_returns_independent_objects():
+    first = build_spec()
+    first.observables["__mutated__"] = []
+    second = build_spec()
+    assert "__mutated__" not in second.observables
+    assert second.observables is not first.observables
+    if second.sources is not None:
+        assert second.sources is not first.sources
+
+
+def test_parameter_names_accept_non_string_keys(tmp_path, monkeypatch):
+    from lv_fiscal_dsge import _spec_io
+
+    (tmp_path / "parameters_fiscal_calibrated.yaml").write_text(
+        "beta: 0.99\n1: 2.0\n0.5: 1.0\n", encoding="utf-8"
+    )
+    monkeypatch.setattr(_spec_io, "MODEL_DIR", tmp_path)
+    assert _spec_io.collect_parameter_names() == {"beta", "1", "0.5"}
@@ -0,0 +1,82 @@
+from lv_fiscal_dsge.steady_state import (
+    ParamsView,
+    compute_financial_frictions_metrics,
+    load_parameters,
+    solve_full_steady_state,
+)
+
+# Keys read by compute_financial_frictions_metrics, including aliases and mu_zplus inputs.
+_FINANCIAL_KEYS = (
+    "alpha",
+    "mu_z",
+    "mu_psi",
+    "beta",
+    "pi_bar",
+    "tau_k",
+    "delta",
+    "gamma",
+    "W_over_y_times100",
+    "mu",
+    "mu_monitoring",
+    "sigma_omega",
+    "sigma_u",
+    "F_omega_bar",
+    "net_worth_to_capital",
+)
+
+
+def test_financial_metrics_accept_partial_parameters() -> None:
+    params = dict(load_parameters())
+    ss = solve_full_steady_state(params)
+    partial = {key: params[key] for key in _FINANCIAL_KEYS if key in params}
+
+    expected = compute_financial_frictions_metrics(ss, params)
+    assert compute_financial_frictions_metrics(ss, partial) == expected
+    assert compute_financial_frictions_metrics(ss, ParamsView.from_dict(params)) == expected
+
+
+def test_financial_metrics_ignore_degenerate_matching_terms() -> None:
+    params = dict(load_parameters())
+    ss = solve_full_steady_state(params)
+    expected = compute_financial_frictions_metrics(ss, params)
+
+    # rho_match * L_bar == 1 zeroes the matching-function denominator, which the
+    # metrics never use.
+    params["rho_match"] = 1.0 / params["L_bar"]
+    assert compute_financial_frictions_metrics(ss, params) == expected
+
+
+def test_parameter_cache_round_trips_nonfinite_values(tmp_path, monkeypatch) -> None:
+    import math
+
+    from lv_fiscal_dsge import steady_state
+
+    monkeypatch.setenv("DSGE_CACHE_DIR", str(tmp_path))
+    fingerprint = steady_state._parameter_fingerprint()
+    params = {"a": 1.5, "b": float("nan"), "c": float("inf"), "d": -float("inf")}
+
+    steady_state._write_parameter_cache(fingerprint, params)
+    loaded = steady_state._read_parameter_cache(fingerprint)
+
+    assert loaded is not None
+    assert loaded["a"] == 1.5 and math.isnan(loaded["b"])
+    assert loaded["c"] == float("inf") and loaded["d"] == -float("inf")
+    stale = [fingerprint[0] + 1, *fingerprint[1:]]
+    assert steady_state._read_parameter_cache(stale) is None
+
+
+def test_parameters_load_without_a_cache_directory(monkeypatch) -> None:
+    from pathlib import Path
+
+    from lv_fiscal_dsge import _paths, steady_state
+
+    def _no_home() -> Path:
+        raise RuntimeError("Could not determine home directory.")
+
+    monkeypatch.delenv("DSGE_CACHE_DIR", raising=False)
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.setattr(Path, "home", staticmethod(_no_home))
+    assert _paths.cache_dir() is None
+
+    steady_state._merged_parameters.cache_clear()
+    assert steady_state.load_parameters()["beta"] > 0.0